@@ -0,0 +1,38 @@
+"""add contact indexes
+
+Revision ID: 5b9e0d4c1a26
+Revises: a3f1c8e2d7b4
+Create Date: 2026-10-15 22:16:12.530871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b9e0d4c1a26'
+down_revision: Union[str, None] = 'a3f1c8e2d7b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_contacts_user_email', 'contacts', ['user_id', 'email'], unique=False)
+    op.create_index('ix_contacts_user_surname', 'contacts', ['user_id', 'surname'], unique=False)
+    op.create_index('ix_contacts_name_trgm', 'contacts', ['name'], unique=False, postgresql_using='gin',
+                    postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_contacts_surname_trgm', 'contacts', ['surname'], unique=False, postgresql_using='gin',
+                    postgresql_ops={'surname': 'gin_trgm_ops'})
+    op.create_index('ix_contacts_email_trgm', 'contacts', ['email'], unique=False, postgresql_using='gin',
+                    postgresql_ops={'email': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_email_trgm', table_name='contacts')
+    op.drop_index('ix_contacts_surname_trgm', table_name='contacts')
+    op.drop_index('ix_contacts_name_trgm', table_name='contacts')
+    op.drop_index('ix_contacts_user_surname', table_name='contacts')
+    op.drop_index('ix_contacts_user_email', table_name='contacts')
@@ -0,0 +1,30 @@
+"""add contact birthday_md
+
+Revision ID: a3f1c8e2d7b4
+Revises: 32aae156d89b
+Create Date: 2026-10-15 22:15:04.118362
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f1c8e2d7b4'
+down_revision: Union[str, None] = '32aae156d89b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('contacts', sa.Column(
+        'birthday_md', sa.Integer(),
+        sa.Computed('EXTRACT(month FROM birthday) * 100 + EXTRACT(day FROM birthday)'), nullable=False))
+    op.create_index(op.f('ix_contacts_birthday_md'), 'contacts', ['birthday_md'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_contacts_birthday_md'), table_name='contacts')
+    op.drop_column('contacts', 'birthday_md')
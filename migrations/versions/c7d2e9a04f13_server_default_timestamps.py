@@ -0,0 +1,40 @@
+"""server default timestamps
+
+Revision ID: c7d2e9a04f13
+Revises: 5b9e0d4c1a26
+Create Date: 2026-10-15 22:19:41.207315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2e9a04f13'
+down_revision: Union[str, None] = '5b9e0d4c1a26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("UPDATE contacts SET created_at = now() WHERE created_at IS NULL")
+    op.execute("UPDATE contacts SET updated_at = created_at WHERE updated_at IS NULL")
+    op.alter_column('contacts', 'created_at', existing_type=sa.DateTime(), server_default=sa.text('now()'),
+                    nullable=False)
+    op.alter_column('contacts', 'updated_at', existing_type=sa.DateTime(), server_default=sa.text('now()'),
+                    nullable=False)
+    op.alter_column('users', 'created_at', existing_type=sa.DateTime(), server_default=sa.text('now()'),
+                    existing_nullable=False)
+    op.alter_column('users', 'updated_at', existing_type=sa.DateTime(), server_default=sa.text('now()'),
+                    existing_nullable=False)
+
+
+def downgrade() -> None:
+    op.alter_column('users', 'updated_at', existing_type=sa.DateTime(), server_default=None,
+                    existing_nullable=False)
+    op.alter_column('users', 'created_at', existing_type=sa.DateTime(), server_default=None,
+                    existing_nullable=False)
+    op.alter_column('contacts', 'updated_at', existing_type=sa.DateTime(), server_default=None, nullable=True)
+    op.alter_column('contacts', 'created_at', existing_type=sa.DateTime(), server_default=None, nullable=True)
@@ -7,8 +7,12 @@ from src.conf.config import config
 
 class DatabaseSessionManager:
     def __init__(self, url: str):
-        self._engine: AsyncEngine | None = create_async_engine(url)
+        self._engine: AsyncEngine | None = create_async_engine(url, pool_size=config.DB_POOL_SIZE,
+                                                               max_overflow=config.DB_MAX_OVERFLOW,
+                                                               pool_pre_ping=True,
+                                                               pool_recycle=config.DB_POOL_RECYCLE)
         self._session_maker: async_sessionmaker = async_sessionmaker(autoflush=False, autocommit=False,
+                                                                     expire_on_commit=False,
                                                                      bind=self._engine)
 
     @contextlib.asynccontextmanager
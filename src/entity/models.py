@@ -2,7 +2,8 @@ import enum
 from datetime import date
 
 from sqlalchemy.orm import Mapped, mapped_column, DeclarativeBase, relationship
-from sqlalchemy import String, Date, Integer, ForeignKey, DateTime, func, Enum, Boolean
+from sqlalchemy import (String, Date, Integer, ForeignKey, DateTime, func, Enum, Boolean, Computed, column, extract,
+                        Index)
 from sqlalchemy.orm import DeclarativeBase
 
 
@@ -12,19 +13,32 @@ class Base(DeclarativeBase):
 
 class Contact(Base):
     __tablename__ = 'contacts'
+    __table_args__ = (
+        Index('ix_contacts_user_email', 'user_id', 'email'),
+        Index('ix_contacts_user_surname', 'user_id', 'surname'),
+        # Trigram indexes make the ILIKE '%...%' filters in get_contacts index-searchable (requires pg_trgm).
+        Index('ix_contacts_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+        Index('ix_contacts_surname_trgm', 'surname', postgresql_using='gin',
+              postgresql_ops={'surname': 'gin_trgm_ops'}),
+        Index('ix_contacts_email_trgm', 'email', postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}),
+    )
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(150))
     surname: Mapped[str] = mapped_column(String(150))
     email: Mapped[str] = mapped_column(unique=True)
     phone: Mapped[str] = mapped_column()
     birthday: Mapped[date] = mapped_column(Date)
+    # MMDD as an integer (e.g. 1231), so the upcoming birthdays window is one indexed range lookup.
+    birthday_md: Mapped[int] = mapped_column(
+        Integer, Computed(extract('month', column('birthday')) * 100 + extract('day', column('birthday'))),
+        index=True)
 
-    created_at: Mapped[date] = mapped_column('created_at', DateTime, default=func.now(), nullable=True)
-    updated_at: Mapped[date] = mapped_column('updated_at', DateTime, default=func.now(), onupdate=func.now(),
-                                             nullable=True)
+    created_at: Mapped[date] = mapped_column('created_at', DateTime, server_default=func.now(), nullable=False)
+    updated_at: Mapped[date] = mapped_column('updated_at', DateTime, server_default=func.now(), onupdate=func.now(),
+                                             nullable=False)
 
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'), nullable=True)
-    user: Mapped["User"] = relationship("User", backref='contacts', lazy='joined')
+    user: Mapped["User"] = relationship("User", backref='contacts', lazy='raise')
 
 
 class Role(enum.Enum):
@@ -41,7 +55,7 @@ class User(Base):
     password: Mapped[str] = mapped_column(String(255), nullable=False)
     avatar: Mapped[str] = mapped_column(String(255), nullable=True)
     refresh_token: Mapped[str] = mapped_column(String(255), nullable=True)
-    created_at: Mapped[date] = mapped_column('created_at', DateTime, default=func.now())
-    updated_at: Mapped[date] = mapped_column('updated_at', DateTime, default=func.now(), onupdate=func.now())
+    created_at: Mapped[date] = mapped_column('created_at', DateTime, server_default=func.now())
+    updated_at: Mapped[date] = mapped_column('updated_at', DateTime, server_default=func.now(), onupdate=func.now())
     role: Mapped[Enum] = mapped_column('role', Enum(Role), default=Role.user, nullable=True)
     confirmed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=True)
\ No newline at end of file
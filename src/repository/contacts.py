@@ -1,15 +1,26 @@
 from datetime import date, timedelta
 
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, delete, lambda_stmt, bindparam
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import or_, and_, extract
+from sqlalchemy.orm import selectinload
+from sqlalchemy import or_
 
 from src.entity.models import Contact, User
 from src.schema import contact
 from src.schema.contact import ContactSchema, ContactUpdate
 
+CONTACT_LIST_COLUMNS = (Contact.id, Contact.name, Contact.surname, Contact.email, Contact.phone, Contact.birthday,
+                        Contact.created_at, Contact.updated_at)
+
+# Point lookups are built once as lambda statements, so each call only binds contact_id and user_id.
+GET_CONTACT = lambda_stmt(lambda: select(Contact).options(selectinload(Contact.user))
+                          .where(Contact.id == bindparam('contact_id'), Contact.user_id == bindparam('user_id')))
+DELETE_CONTACT = lambda_stmt(lambda: delete(Contact)
+                             .where(Contact.id == bindparam('contact_id'), Contact.user_id == bindparam('user_id'))
+                             .returning(Contact.id))
+
 
 async def get_contacts(limit: int, offset: int, name: str, surname: str, email: str, db: AsyncSession,
                        user: User):
@@ -26,9 +37,9 @@ async def get_contacts(limit: int, offset: int, name: str, surname: str, email:
             user (User): The user whose contacts are being retrieved.
 
         Returns:
-            List[Contact]: A list of contacts that match the criteria.
+            List[Row]: A list of contact rows (without the owner) that match the criteria.
         """
-    statement = select(Contact).filter_by(user=user).offset(offset).limit(limit)
+    statement = select(*CONTACT_LIST_COLUMNS).filter_by(user_id=user.id).offset(offset).limit(limit)
 
     if name:
         statement = statement.filter(Contact.name.ilike(f"%{name}%"))
@@ -38,27 +49,25 @@ async def get_contacts(limit: int, offset: int, name: str, surname: str, email:
         statement = statement.filter(Contact.email.ilike(f"%{email}%"))
 
     contacts = await db.execute(statement)
-    await db.close()
-    return contacts.scalars().all()
+    return contacts.all()
 
 
-async def get_all_contacts(limit: int, offset: int, db: AsyncSession):
+async def get_all_contacts(limit: int | None, offset: int, db: AsyncSession):
     """
-        Retrieves a list of all contacts in the database with pagination.
+        Streams all contacts in the database through a server-side cursor.
 
         Args:
-            limit (int): The maximum number of contacts to return.
+            limit (int | None): The maximum number of contacts to return, or None for all of them.
             offset (int): The offset to start the query from.
             db (AsyncSession): The database session.
 
         Returns:
-            List[Contact]: A list of contacts.
+            AsyncScalarResult[Contact]: An async iterator over the contacts, fetched 500 rows at a time.
         """
-    statement = select(Contact).offset(offset).limit(limit)
+    statement = (select(Contact).options(selectinload(Contact.user)).order_by(Contact.id).offset(offset).limit(limit)
+                 .execution_options(yield_per=500))
 
-    contacts = await db.execute(statement)
-    await db.close()
-    return contacts.scalars().all()
+    return await db.stream_scalars(statement)
 
 
 async def get_contact(contact_id: int, db: AsyncSession, user: User):
@@ -73,9 +82,7 @@ async def get_contact(contact_id: int, db: AsyncSession, user: User):
         Returns:
             Contact or None: The requested contact, or None if not found.
         """
-    statement = select(Contact).filter_by(id=contact_id, user=user)
-    contact = await db.execute(statement)
-    await db.close()
+    contact = await db.execute(GET_CONTACT, {'contact_id': contact_id, 'user_id': user.id})
     return contact.scalar_one_or_none()
 
 
@@ -98,16 +105,46 @@ async def create_contact(body: ContactSchema, db: AsyncSession, user: User):
         raise HTTPException(status_code=400, detail="Birthday must be in the past")
 
     try:
-        contact = Contact(**body.model_dump(), user=user)
-        db.add(contact)
+        statement = (insert(Contact).values(**body.model_dump(), user_id=user.id)
+                     .returning(Contact).options(selectinload(Contact.user)))
+        contact = await db.execute(statement)
+        contact = contact.scalar_one()
         await db.commit()
-        await db.refresh(contact)
         return contact
     except SQLAlchemyError as e:
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
-    finally:
-        await db.close()
+
+
+async def create_contacts(bodies: list[ContactSchema], db: AsyncSession, user: User):
+    """
+        Creates several contacts for a user with a single bulk INSERT ... RETURNING.
+
+        Args:
+            bodies (list[ContactSchema]): The contacts data to create.
+            db (AsyncSession): The database session.
+            user (User): The user for whom the contacts are being created.
+
+        Returns:
+            List[Contact]: The newly created contacts, in the order they were given.
+
+        Raises:
+            HTTPException: If any birthday is in the future or a database error occurs.
+        """
+    if not bodies:
+        return []
+    if any(body.birthday >= date.today() for body in bodies):
+        raise HTTPException(status_code=400, detail="Birthday must be in the past")
+
+    try:
+        statement = insert(Contact).returning(Contact, sort_by_parameter_order=True).options(selectinload(Contact.user))
+        contacts = await db.scalars(statement, [{**body.model_dump(), 'user_id': user.id} for body in bodies])
+        contacts = contacts.all()
+        await db.commit()
+        return contacts
+    except SQLAlchemyError as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
 async def update_contact(contact_id: int, contact_update: ContactUpdate, db: AsyncSession, user: User):
@@ -116,7 +153,7 @@ async def update_contact(contact_id: int, contact_update: ContactUpdate, db: Asy
 
         Args:
             contact_id (int): The ID of the contact to update.
-            contact_update (ContactUpdate): The updated contact data.
+            contact_update (ContactUpdate): The fields to change; fields that are not sent are left as they are.
             db (AsyncSession): The database session.
             user (User): The user whose contact is being updated.
 
@@ -126,19 +163,22 @@ async def update_contact(contact_id: int, contact_update: ContactUpdate, db: Asy
         Raises:
             HTTPException: If the contact is not found.
         """
-    statement = select(Contact).filter_by(id=contact_id, user=user)
+    values = contact_update.model_dump(exclude_unset=True, exclude_none=True)
+    if not values:
+        existing_contact = await get_contact(contact_id, db, user)
+        if not existing_contact:
+            raise HTTPException(status_code=404, detail="Contact not found")
+        return existing_contact
+
+    statement = (update(Contact).where(Contact.id == contact_id, Contact.user_id == user.id)
+                 .values(**values).returning(Contact).options(selectinload(Contact.user)))
     existing_contact = await db.execute(statement)
     existing_contact = existing_contact.scalar_one_or_none()
 
     if not existing_contact:
         raise HTTPException(status_code=404, detail="Contact not found")
 
-    if existing_contact:
-        for key, value in contact_update.model_dump().items():
-            setattr(existing_contact, key, value)
-        await db.commit()
-        await db.refresh(existing_contact)
-        await db.close()
+    await db.commit()
     return existing_contact
 
 
@@ -152,22 +192,19 @@ async def delete_contact(contact_id: int, db: AsyncSession, user: User):
             user (User): The user whose contact is being deleted.
 
         Returns:
-            Contact or None: The deleted contact, or None if not found.
+            int: The ID of the deleted contact.
 
         Raises:
             HTTPException: If the contact is not found.
         """
-    statement = select(Contact).filter_by(id=contact_id, user=user)
-    contact = await db.execute(statement)
-    contact = contact.scalar_one_or_none()
+    deleted_id = await db.execute(DELETE_CONTACT, {'contact_id': contact_id, 'user_id': user.id})
+    deleted_id = deleted_id.scalar_one_or_none()
 
-    if not contact:
+    if not deleted_id:
         raise HTTPException(status_code=404, detail="Contact not found")
 
-    if contact:
-        await db.delete(contact)
-        await db.commit()
-        return contact
+    await db.commit()
+    return deleted_id
 
 
 async def get_upcoming_birthdays(db: AsyncSession, user: User):
@@ -179,35 +216,20 @@ async def get_upcoming_birthdays(db: AsyncSession, user: User):
             user (User): The user whose contacts are being checked for upcoming birthdays.
 
         Returns:
-            List[Contact]: A list of contacts with upcoming birthdays.
+            List[Row]: A list of contact rows (without the owner) with upcoming birthdays.
         """
     today = date.today()
     next_week = today + timedelta(days=7)
+    today_md = today.month * 100 + today.day
+    next_week_md = next_week.month * 100 + next_week.day
+
+    if today_md <= next_week_md:
+        window = Contact.birthday_md.between(today_md, next_week_md)
+    else:
+        # The week wraps around the new year.
+        window = or_(Contact.birthday_md >= today_md, Contact.birthday_md <= next_week_md)
 
-    query = select(Contact).filter(
-        or_(
-            and_(
-                extract('month', Contact.birthday) == today.month,
-                extract('day', Contact.birthday) >= today.day,
-                extract('month', Contact.birthday) == next_week.month,
-                extract('day', Contact.birthday) <= next_week.day,
-            ),
-            and_(
-                today.month != next_week.month,
-                or_(
-                    and_(
-                        extract('month', Contact.birthday) == today.month,
-                        extract('day', Contact.birthday) >= today.day,
-                    ),
-                    and_(
-                        extract('month', Contact.birthday) == next_week.month,
-                        extract('day', Contact.birthday) <= next_week.day,
-                    )
-                )
-            )
-        )
-    )
+    query = select(*CONTACT_LIST_COLUMNS).filter_by(user_id=user.id).filter(window)
 
     result = await db.execute(query)
-    await db.close()
-    return result.scalars().all()
+    return result.all()
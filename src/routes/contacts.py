@@ -1,39 +1,60 @@
+from datetime import date
+
 from fastapi import APIRouter, HTTPException, Depends, status, Path, Query
+from fastapi.responses import StreamingResponse, ORJSONResponse, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
 from src.entity.models import User, Role
 from src.repository import contacts as repository_contacts
-from src.schema.contact import ContactSchema, ContactUpdate, ContactResponse
+from src.schema.contact import ContactSchema, ContactUpdate, ContactResponse, ContactListResponse
 from src.services.auth import auth_service
+from src.services import cache
 from src.services.roles import RoleAccess
 
-router = APIRouter(prefix='/contacts', tags=['contacts'])
+router = APIRouter(prefix='/contacts', tags=['contacts'], default_response_class=ORJSONResponse)
 
 access_to_route_all = RoleAccess([Role.admin, Role.moderator])
 
+# Validates and dumps a whole page in one pass; the JSON bytes are cached and served as they are.
+contact_list_adapter = TypeAdapter(list[ContactListResponse])
+
 
-@router.get('/', response_model=list[ContactResponse])
+@router.get('/', response_model=list[ContactListResponse])
 async def get_contacts(limit: int = Query(10, ge=10, le=100), offset: int = Query(0, ge=0),
                        name: str = Query(None, title="Name filter"), surname: str = Query(None, title="Surname filter"),
                        email: str = Query(None, title="Email filter"), db: AsyncSession = Depends(get_db),
                        user: User = Depends(auth_service.get_current_user)):
+    key = await cache.contacts_key(user.id, "list", name=name, surname=surname, email=email, offset=offset,
+                                   limit=limit)
+    contacts = await cache.get_cached_contacts(key)
+    if contacts:
+        return Response(contacts, media_type="application/json")
     contacts = await repository_contacts.get_contacts(limit, offset, name, surname, email, db, user)
     if contacts:
-        return contacts
+        contacts = contact_list_adapter.dump_json(contact_list_adapter.validate_python(contacts, from_attributes=True))
+        await cache.set_cached_contacts(key, contacts)
+        return Response(contacts, media_type="application/json")
     else:
         raise HTTPException(status_code=404, detail="Contacts not found")
 
 
-@router.get('/all', response_model=list[ContactResponse], dependencies=[Depends(access_to_route_all)])
-async def get_all_contacts(limit: int = Query(10, ge=10, le=100), offset: int = Query(0, ge=0),
+@router.get('/all', response_class=StreamingResponse, dependencies=[Depends(access_to_route_all)])
+async def get_all_contacts(limit: int = Query(None, ge=10), offset: int = Query(0, ge=0),
                            db: AsyncSession = Depends(get_db)):
     contacts = await repository_contacts.get_all_contacts(limit, offset, db)
-    if contacts:
-        return contacts
-    else:
+    first = await anext(contacts, None)
+    if first is None:
         raise HTTPException(status_code=404, detail="Contacts not found")
 
+    async def generate():
+        yield ContactResponse.model_validate(first).model_dump_json().encode() + b"\n"
+        async for contact in contacts:
+            yield ContactResponse.model_validate(contact).model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
 
 @router.get('/{contacts_id}', response_model=ContactResponse)
 async def get_contact(contacts_id: int, db: AsyncSession = Depends(get_db),
@@ -49,14 +70,24 @@ async def get_contact(contacts_id: int, db: AsyncSession = Depends(get_db),
 async def create_contact(body: ContactSchema, db: AsyncSession = Depends(get_db),
                          user: User = Depends(auth_service.get_current_user)):
     contact = await repository_contacts.create_contact(body, db, user)
+    await cache.invalidate_contacts(user.id)
     return contact
 
 
+@router.post('/bulk', response_model=list[ContactResponse], status_code=status.HTTP_201_CREATED)
+async def create_contacts(body: list[ContactSchema], db: AsyncSession = Depends(get_db),
+                          user: User = Depends(auth_service.get_current_user)):
+    contacts = await repository_contacts.create_contacts(body, db, user)
+    await cache.invalidate_contacts(user.id)
+    return contacts
+
+
 @router.put('/{contacts_id}', response_model=ContactResponse, status_code=status.HTTP_200_OK)
 async def update_contact(contacts_id: int, body: ContactUpdate, db: AsyncSession = Depends(get_db),
                          user: User = Depends(auth_service.get_current_user)):
     contact = await repository_contacts.update_contact(contacts_id, body, db, user)
     if contact:
+        await cache.invalidate_contacts(user.id)
         return contact
     else:
         raise HTTPException(status_code=404, detail="Contact not found")
@@ -67,16 +98,23 @@ async def delete_contact(contacts_id: int, db: AsyncSession = Depends(get_db),
                          user: User = Depends(auth_service.get_current_user)):
     contact = await repository_contacts.delete_contact(contacts_id, db, user)
     if contact:
+        await cache.invalidate_contacts(user.id)
         return contact
     else:
         raise HTTPException(status_code=404, detail="Contact not found")
 
 
-@router.get("/birthday/", response_model=list[ContactResponse])
+@router.get("/birthday/", response_model=list[ContactListResponse])
 async def get_upcoming_birthdays(db: AsyncSession = Depends(get_db),
                                  user: User = Depends(auth_service.get_current_user)):
+    key = await cache.contacts_key(user.id, "birthdays", today=date.today())
+    contacts = await cache.get_cached_contacts(key)
+    if contacts:
+        return Response(contacts, media_type="application/json")
     contacts = await repository_contacts.get_upcoming_birthdays(db, user)
     if contacts:
-        return contacts
+        contacts = contact_list_adapter.dump_json(contact_list_adapter.validate_python(contacts, from_attributes=True))
+        await cache.set_cached_contacts(key, contacts)
+        return Response(contacts, media_type="application/json")
     else:
         raise HTTPException(status_code=404, detail="Contacts not found")
@@ -1,5 +1,3 @@
-import pickle
-
 import cloudinary
 import cloudinary.uploader
 from fastapi import (
@@ -44,6 +42,5 @@ async def get_current_user(
         width=250, height=250, crop="fill", version=res.get("version")
     )
     user = await repositories_users.update_avatar_url(user.email, res_url, db)
-    auth_service.cache.set(user.email, pickle.dumps(user))
-    auth_service.cache.expire(user.email, 300)
+    await auth_service.cache_user(user)
     return user
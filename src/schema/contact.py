@@ -14,15 +14,17 @@ class ContactSchema(BaseModel):
     birthday: date
 
 
-class ContactUpdate(BaseModel):
-    name: str
-    surname: str
-    email: EmailStr
-    phone: str
-    birthday: date
+class ContactUpdate(ContactSchema):
+    name: str | None = Field(None, max_length=150)
+    surname: str | None = Field(None, max_length=150)
+    email: EmailStr | None = None
+    phone: str | None = None
+    birthday: date | None = None
+
+    model_config = ConfigDict(extra='forbid')
 
 
-class ContactResponse(BaseModel):
+class ContactListResponse(BaseModel):
     id: int = 1
     name: str
     surname: str
@@ -31,6 +33,9 @@ class ContactResponse(BaseModel):
     birthday: date
     created_at: datetime | None
     updated_at: datetime | None
-    user: UserResponse | None
 
-    model_config = ConfigDict(from_attributes = True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes = True)
+
+
+class ContactResponse(ContactListResponse):
+    user: UserResponse | None
\ No newline at end of file
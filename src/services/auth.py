@@ -2,29 +2,33 @@ import pickle
 from datetime import datetime, timedelta
 from typing import Optional
 
-import redis
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from passlib.context import CryptContext
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from jose import JWTError, jwt
 
 from src.database.db import get_db
+from src.entity.models import User
 from src.repository import users as repository_users
 from src.conf.config import config
+from src.services.cache import cache as redis_cache
 
 
 class Auth:
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=config.BCRYPT_ROUNDS)
     SECRET_KEY = config.SECRET_KEY_JWT
     ALGORITHM = config.ALGORITHM
-    cache = redis.Redis(host=config.REDIS_DOMAIN, port=config.REDIS_PORT, db=0, password=config.REDIS_PASSWORD)
+    cache = redis_cache
+    USER_TTL = 300
 
-    def verify_password(self, plain_password, hashed_password):
-        return self.pwd_context.verify(plain_password, hashed_password)
+    # bcrypt is CPU-bound, so it runs in the threadpool instead of blocking the event loop.
+    async def verify_password(self, plain_password, hashed_password):
+        return await run_in_threadpool(self.pwd_context.verify, plain_password, hashed_password)
 
-    def get_password_hash(self, password: str):
-        return self.pwd_context.hash(password)
+    async def get_password_hash(self, password: str):
+        return await run_in_threadpool(self.pwd_context.hash, password)
 
     oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
@@ -77,21 +81,25 @@ class Auth:
         except JWTError as e:
             raise credentials_exception
 
-        user_hash = str(email)
-        user = self.cache.get(user_hash)
+        user = await self.cache.get(f"user:{email}")
 
         if user is None:
             print('User from db')
             user = await repository_users.get_user_by_email(email, db)
             if user is None:
                 raise credentials_exception
-            self.cache.set(user_hash, pickle.dumps(user))
-            self.cache.expire(user_hash, 300)
+            await self.cache_user(user)
         else:
             print('User from cache')
             user = pickle.loads(user)
         return user
 
+    async def cache_user(self, user: User):
+        await self.cache.set(f"user:{user.email}", pickle.dumps(user), ex=self.USER_TTL)
+
+    async def clear_cached_user(self, email: str):
+        await self.cache.delete(f"user:{email}")
+
     def create_email_token(self, data: dict):
         to_encode = data.copy()
         expire = datetime.utcnow() + timedelta(days=2)
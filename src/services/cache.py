@@ -0,0 +1,43 @@
+import hashlib
+import json
+
+import redis.asyncio as redis
+
+from src.conf.config import config
+
+CONTACTS_TTL = 60
+
+cache = redis.Redis(host=config.REDIS_DOMAIN, port=config.REDIS_PORT, db=0, password=config.REDIS_PASSWORD)
+
+
+async def contacts_key(user_id: int, scope: str, **params) -> str:
+    """
+        Builds the cache key for a user's contact list.
+
+        The key embeds the user's contacts version, so bumping the version in
+        invalidate_contacts makes every previously cached list unreachable.
+
+        Args:
+            user_id (int): The owner of the contacts.
+            scope (str): The list being cached, e.g. "list" or "birthdays".
+            **params: Filters and pagination that identify the list.
+
+        Returns:
+            str: The cache key.
+        """
+    version = await cache.get(f"contacts:{user_id}:version")
+    version = int(version) if version else 0
+    digest = hashlib.blake2b(json.dumps(params, sort_keys=True, default=str).encode(), digest_size=8).hexdigest()
+    return f"contacts:{user_id}:{version}:{scope}:{digest}"
+
+
+async def get_cached_contacts(key: str) -> bytes | None:
+    return await cache.get(key)
+
+
+async def set_cached_contacts(key: str, contacts: bytes) -> None:
+    await cache.setex(key, CONTACTS_TTL, contacts)
+
+
+async def invalidate_contacts(user_id: int) -> None:
+    await cache.incr(f"contacts:{user_id}:version")
@@ -0,0 +1,35 @@
+from aiodataloader import DataLoader
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.database.db import get_db
+from src.entity.models import Contact, User
+from src.services.auth import auth_service
+
+
+class ContactLoader(DataLoader):
+    """
+        Coalesces concurrent loads of the user's contacts into one ``WHERE id IN (...)`` query.
+
+        ``await asyncio.gather(*(loader.load(i) for i in ids))`` issues a single SELECT however many
+        ids are requested. Contacts that do not exist or belong to another user load as None.
+        """
+
+    def __init__(self, db: AsyncSession, user: User):
+        super().__init__()
+        self.db = db
+        self.user = user
+
+    async def batch_load_fn(self, ids: list[int]) -> list[Contact | None]:
+        statement = (select(Contact).options(selectinload(Contact.user))
+                     .where(Contact.id.in_(ids), Contact.user_id == self.user.id))
+        contacts = await self.db.execute(statement)
+        contacts = {contact.id: contact for contact in contacts.scalars()}
+        return [contacts.get(contact_id) for contact_id in ids]
+
+
+async def get_contact_loader(db: AsyncSession = Depends(get_db),
+                             user: User = Depends(auth_service.get_current_user)) -> ContactLoader:
+    return ContactLoader(db, user)
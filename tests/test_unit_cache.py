@@ -0,0 +1,67 @@
+import unittest
+from datetime import date
+from unittest.mock import AsyncMock, patch
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.entity.models import User
+from src.routes import contacts as routes_contacts
+from src.services import cache
+
+
+class TestContactsCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.user = User(id=1, username='test_user', password="qwerty", confirmed=True)
+        self.session = AsyncMock(spec=AsyncSession)
+        patcher = patch("src.services.cache.cache", new_callable=AsyncMock)
+        self.redis = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.redis.get.return_value = None
+
+    async def test_contacts_key_depends_on_filters_and_pagination(self):
+        params = dict(name="John", surname=None, email=None, offset=0, limit=10)
+        key = await cache.contacts_key(self.user.id, "list", **params)
+        self.assertTrue(key.startswith("contacts:1:0:list:"))
+        self.assertEqual(key, await cache.contacts_key(self.user.id, "list", **params))
+        for change in (dict(name="Jane"), dict(surname="Doe"), dict(email="a@example.com"), dict(offset=10),
+                       dict(limit=20)):
+            self.assertNotEqual(key, await cache.contacts_key(self.user.id, "list", **{**params, **change}))
+        self.assertNotEqual(key, await cache.contacts_key(self.user.id, "birthdays", **params))
+        self.assertNotEqual(key, await cache.contacts_key(2, "list", **params))
+
+    async def test_invalidate_contacts_bumps_version(self):
+        key = await cache.contacts_key(self.user.id, "list", offset=0, limit=10)
+        await cache.invalidate_contacts(self.user.id)
+        self.redis.incr.assert_called_once_with("contacts:1:version")
+        self.redis.get.return_value = b"1"
+        new_key = await cache.contacts_key(self.user.id, "list", offset=0, limit=10)
+        self.redis.get.assert_called_with("contacts:1:version")
+        self.assertNotEqual(key, new_key)
+        self.assertTrue(new_key.startswith("contacts:1:1:list:"))
+
+    async def test_get_contacts_cache_hit_skips_db(self):
+        cached = b'[{"id":1,"name":"John"}]'
+        self.redis.get.side_effect = [None, cached]
+        response = await routes_contacts.get_contacts(limit=10, offset=0, name=None, surname=None, email=None,
+                                                      db=self.session, user=self.user)
+        self.assertEqual(response.body, cached)
+        self.session.execute.assert_not_called()
+        self.redis.setex.assert_not_called()
+
+    async def test_get_contacts_cache_miss_stores_page(self):
+        rows = [dict(id=1, name="John", surname="Doe", email="john.doe@example.com", phone="1234567890",
+                     birthday=date(1990, 1, 1), created_at=None, updated_at=None)]
+        with patch("src.repository.contacts.get_contacts", AsyncMock(return_value=rows)):
+            response = await routes_contacts.get_contacts(limit=10, offset=0, name=None, surname=None, email=None,
+                                                          db=self.session, user=self.user)
+        key, ttl, body = self.redis.setex.call_args.args
+        self.assertTrue(key.startswith("contacts:1:0:list:"))
+        self.assertEqual(ttl, cache.CONTACTS_TTL)
+        self.assertEqual(body, response.body)
+
+    async def test_get_upcoming_birthdays_cache_hit_skips_db(self):
+        cached = b'[{"id":1,"name":"John"}]'
+        self.redis.get.side_effect = [None, cached]
+        response = await routes_contacts.get_upcoming_birthdays(db=self.session, user=self.user)
+        self.assertEqual(response.body, cached)
+        self.session.execute.assert_not_called()
@@ -0,0 +1,24 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, AsyncMock
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.entity.models import Contact, User
+from src.services.loaders import ContactLoader
+
+
+class TestContactLoader(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.user = User(id=1, username='test_user', password="qwerty", confirmed=True)
+        self.session = AsyncMock(spec=AsyncSession)
+
+    async def test_load_many_batches_into_one_query(self):
+        contacts = [Contact(id=2, name="Jane"), Contact(id=1, name="John")]
+        mock_result = MagicMock()
+        mock_result.scalars.return_value = contacts
+        self.session.execute.return_value = mock_result
+        loader = ContactLoader(self.session, self.user)
+        result = await asyncio.gather(*(loader.load(contact_id) for contact_id in [1, 2, 3]))
+        self.assertEqual(result, [contacts[1], contacts[0], None])
+        self.session.execute.assert_called_once()
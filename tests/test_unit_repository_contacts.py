@@ -1,12 +1,13 @@
 import unittest
 from datetime import date, timedelta
-from unittest.mock import MagicMock, AsyncMock, Mock
+from unittest.mock import MagicMock, AsyncMock, Mock, patch
 
+from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.entity.models import Contact, User
 from src.schema.contact import ContactSchema, ContactUpdate
-from src.repository.contacts import get_contacts, get_all_contacts, get_contact, create_contact, update_contact, delete_contact, get_upcoming_birthdays
+from src.repository.contacts import get_contacts, get_all_contacts, get_contact, create_contact, create_contacts, update_contact, delete_contact, get_upcoming_birthdays
 
 
 class TestAsyncContact(unittest.IsolatedAsyncioTestCase):
@@ -17,14 +18,11 @@ class TestAsyncContact(unittest.IsolatedAsyncioTestCase):
     async def test_get_all_contacts(self):
         limit = 10
         offset = 0
-        contacts = [Contact(),
-                    Contact()]
-        mocked_todos = MagicMock()
-        mocked_todos.scalars.return_value.all.return_value = contacts
-        self.session.execute.return_value = mocked_todos
+        contacts = MagicMock()
+        self.session.stream_scalars.return_value = contacts
         result = await get_all_contacts(limit, offset, self.session)
         self.assertEqual(result, contacts)
-        self.session.execute.assert_called_once()
+        self.session.stream_scalars.assert_called_once()
 
     async def test_get_contacts(self):
         limit = 5
@@ -32,7 +30,7 @@ class TestAsyncContact(unittest.IsolatedAsyncioTestCase):
         name = 'John'
         contacts = [Contact(name='John'), Contact(name='Johnny')]
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = contacts
+        mock_result.all.return_value = contacts
         self.session.execute.return_value = mock_result
         result = await get_contacts(limit, offset, name, None, None, self.session, self.user)
         self.assertEqual(result, contacts)
@@ -52,52 +50,113 @@ class TestAsyncContact(unittest.IsolatedAsyncioTestCase):
         contact_data = ContactSchema(name="John", surname="Doe", email="john.doe@example.com", phone="1234567890",
                                      birthday=date(1990, 1, 1))
         new_contact = Contact(**contact_data.model_dump(), user_id=self.user.id)
-        self.session.add = Mock()
+        mock_result = MagicMock()
+        mock_result.scalar_one.return_value = new_contact
+        self.session.execute.return_value = mock_result
         self.session.commit = AsyncMock()
-        self.session.refresh = AsyncMock()
         result = await create_contact(contact_data, self.session, self.user)
-        self.session.add.assert_called_once()
+        self.assertEqual(result, new_contact)
+        self.session.execute.assert_called_once()
+        self.session.commit.assert_called_once()
+
+    async def test_create_contacts(self):
+        contacts_data = [ContactSchema(name="John", surname="Doe", email="john.doe@example.com", phone="1234567890",
+                                       birthday=date(1990, 1, 1)),
+                         ContactSchema(name="Jane", surname="Doe", email="jane.doe@example.com", phone="0987654321",
+                                       birthday=date(1991, 2, 2))]
+        new_contacts = [Contact(**contact_data.model_dump(), user_id=self.user.id) for contact_data in contacts_data]
+        mock_result = MagicMock()
+        mock_result.all.return_value = new_contacts
+        self.session.scalars.return_value = mock_result
+        self.session.commit = AsyncMock()
+        result = await create_contacts(contacts_data, self.session, self.user)
+        self.assertEqual(result, new_contacts)
+        self.session.scalars.assert_called_once()
+        self.assertEqual(len(self.session.scalars.call_args.args[1]), 2)
         self.session.commit.assert_called_once()
-        self.session.refresh.assert_called_once()
 
     async def test_update_contact(self):
         contact_id = 1
         contact_update = ContactUpdate(name="John", surname="Doe", email="john.doe@example.com", phone="1234567890",
                                        birthday=date(1990, 1, 1))
-        existing_contact = Contact(id=1, name="Old Name", surname="Old Surname", email="old.email@example.com",
-                                   phone="0987654321", birthday=date(1989, 12, 31), user_id=self.user.id)
+        updated_contact = Contact(id=1, **contact_update.model_dump(), user_id=self.user.id)
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = existing_contact
+        mock_result.scalar_one_or_none.return_value = updated_contact
         self.session.execute.return_value = mock_result
         self.session.commit = AsyncMock()
-        self.session.refresh = AsyncMock()
         result = await update_contact(contact_id, contact_update, self.session, self.user)
+        self.assertEqual(result, updated_contact)
+        self.session.execute.assert_called_once()
+        self.session.commit.assert_called_once()
 
-        for key, value in contact_update.model_dump().items():
-            self.assertEqual(getattr(existing_contact, key), value)
+    async def test_update_contact_partial(self):
+        contact_update = ContactUpdate(phone="1234567890")
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = Contact(id=1, phone="1234567890", user_id=self.user.id)
+        self.session.execute.return_value = mock_result
+        self.session.commit = AsyncMock()
+        await update_contact(1, contact_update, self.session, self.user)
+        statement = self.session.execute.call_args.args[0]
+        self.assertEqual(set(statement.compile().params) - {"id_1", "user_id_1"}, {"phone"})
 
-        self.session.commit.assert_called_once()
-        self.session.refresh.assert_called_once_with(existing_contact)
+    async def test_update_contact_not_found(self):
+        contact_update = ContactUpdate(name="John", surname="Doe", email="john.doe@example.com", phone="1234567890",
+                                       birthday=date(1990, 1, 1))
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        self.session.execute.return_value = mock_result
+        self.session.commit = AsyncMock()
+        with self.assertRaises(HTTPException):
+            await update_contact(1, contact_update, self.session, self.user)
+        self.session.commit.assert_not_called()
 
     async def test_delete_contact(self):
         contact_id = 1
-        contact = Contact(id=1, user_id=self.user.id)
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = contact
+        mock_result.scalar_one_or_none.return_value = contact_id
         self.session.execute.return_value = mock_result
-        self.session.delete = AsyncMock()
         self.session.commit = AsyncMock()
         result = await delete_contact(contact_id, self.session, self.user)
-        self.assertEqual(result, contact)
-        self.session.delete.assert_called_once_with(contact)
+        self.assertEqual(result, contact_id)
+        self.session.execute.assert_called_once()
         self.session.commit.assert_called_once()
 
+    async def test_delete_contact_not_found(self):
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        self.session.execute.return_value = mock_result
+        self.session.commit = AsyncMock()
+        with self.assertRaises(HTTPException):
+            await delete_contact(1, self.session, self.user)
+        self.session.commit.assert_not_called()
+
     async def test_get_upcoming_birthdays(self):
         upcoming_birthdays = [Contact(birthday=date.today() + timedelta(days=3)),
                               Contact(birthday=date.today() + timedelta(days=5))]
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = upcoming_birthdays
+        mock_result.all.return_value = upcoming_birthdays
         self.session.execute.return_value = mock_result
         result = await get_upcoming_birthdays(self.session, self.user)
         self.assertEqual(result, upcoming_birthdays)
         self.session.execute.assert_called_once()
+
+    async def test_get_upcoming_birthdays_window(self):
+        self.session.execute.return_value = MagicMock()
+        with patch("src.repository.contacts.date") as mock_date:
+            mock_date.today.return_value = date(2024, 6, 10)
+            await get_upcoming_birthdays(self.session, self.user)
+        statement = self.session.execute.call_args.args[0].compile()
+        self.assertIn("contacts.birthday_md BETWEEN", str(statement))
+        self.assertNotIn(" OR ", str(statement))
+        self.assertEqual(statement.params, {"user_id_1": self.user.id, "birthday_md_1": 610, "birthday_md_2": 617})
+
+    async def test_get_upcoming_birthdays_window_over_new_year(self):
+        self.session.execute.return_value = MagicMock()
+        with patch("src.repository.contacts.date") as mock_date:
+            mock_date.today.return_value = date(2024, 12, 28)
+            await get_upcoming_birthdays(self.session, self.user)
+        statement = self.session.execute.call_args.args[0].compile()
+        self.assertIn("contacts.birthday_md >= :birthday_md_1 OR contacts.birthday_md <= :birthday_md_2",
+                      str(statement))
+        self.assertNotIn("BETWEEN", str(statement))
+        self.assertEqual(statement.params, {"user_id_1": self.user.id, "birthday_md_1": 1228, "birthday_md_2": 104})
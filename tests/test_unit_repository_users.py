@@ -28,7 +28,7 @@ class TestAsyncUser(unittest.IsolatedAsyncioTestCase):
 
     async def test_create_user(self):
         user_data = UserSchema(username="new_user", email="new@example.com", password="pass1234")
-        new_user = User(**user_data.dict(), avatar="avatar_url")
+        new_user = User(**user_data.model_dump(), avatar="avatar_url")
 
         self.session.add = Mock()
         self.session.commit = AsyncMock()